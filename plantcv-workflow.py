@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 import os
+import re
 import sys
 import argparse
 import time
@@ -8,6 +9,10 @@ import plantcv.parallel
 import tempfile
 import shutil
 
+# Precompiled pattern for scanning metadata:value pairs out of the --match argument
+# A value is either a bracketed list of allowed values or a single value
+MATCH_PAIR = re.compile(r"([^,:]+):(\[[^\]]*\]|[^,]*)")
+
 
 # Parse command-line arguments
 ###########################################
@@ -63,7 +68,8 @@ def options():
     cmdline_grp.add_argument("-M", "--match",
                              help='Restrict analysis to images with metadata matching input criteria. Input a '
                                   'metadata:value comma-separated list. This is an exact match search. '
-                                  'E.g. imgtype:VIS,camera:SV,zoom:z500',
+                                  'A value can also be a bracketed list of allowed values. '
+                                  'E.g. imgtype:VIS,camera:SV,zoom:z500 or imgtype:[VIS,NIR],camera:SV',
                              required=False)
     cmdline_grp.add_argument("-C", "--coprocess",
                              help='Coprocess the specified imgtype with the imgtype specified in --match '
@@ -106,10 +112,21 @@ def options():
         # Metadata restrictions
         args.imgtype = {}
         if args.match is not None:
-            pairs = args.match.split(',')
-            for pair in pairs:
-                key, value = pair.split(':')
+            # Parse the key:value pairs in a single regex scan instead of nested splits.
+            # The scan must consume the whole argument; any leftover text is a malformed pair
+            pos = 0
+            for pair in MATCH_PAIR.finditer(args.match):
+                if pair.start() != pos:
+                    raise ValueError(f"Invalid metadata:value pair in --match argument: {args.match}")
+                key, value = pair.group(1), pair.group(2)
+                # Bracketed values are lists of allowed values
+                if value.startswith("[") and value.endswith("]"):
+                    value = value[1:-1].split(",")
                 args.imgtype[key] = value
+                # Step past the pair and the comma separating it from the next one
+                pos = pair.end() + 1
+            if pos < len(args.match):
+                raise ValueError(f"Invalid metadata:value pair in --match argument: {args.match}")
 
         # Populate config object
         config.input_dir = args.dir
@@ -1,7 +1,10 @@
 import os
 import re
 import sys
+import csv
 import datetime
+import functools
+from concurrent.futures import ProcessPoolExecutor
 
 
 # Parse metadata from filenames in a directory
@@ -29,176 +32,393 @@ def metadata_parser(config):
     start_date_unixtime = convert_datetime_to_unixtime(timestamp_str=start_date, date_format=config.timestampformat)
     end_date_unixtime = convert_datetime_to_unixtime(timestamp_str=end_date, date_format=config.timestampformat)
 
-    # Metadata data structure
-    meta = {}
+    # Metadata parsing is pure Python string work, so it is chunked across a process pool
+    # when more than one worker is configured. For batch-scheduler clusters n_workers counts
+    # remote jobs, not local cores, so cap the pool at the local CPU count
+    n_workers = min(config.cluster_config.get("n_workers", 1), os.cpu_count() or 1)
+
+    # Check whether there is a snapshot metadata file or not
+    if os.path.exists(os.path.join(config.input_dir, "SnapshotInfo.csv")):
+        # Open the SnapshotInfo.csv file with a large read buffer to minimize syscalls
+        with open(os.path.join(config.input_dir, 'SnapshotInfo.csv'), 'r', buffering=1 << 20, newline='') as csvfile:
+            reader = csv.reader(csvfile)
+
+            # Table column order, removing whitespace from the field names
+            # (e.g. "plant barcode" maps to the plantbarcode metadata term)
+            header = next(reader, [])
+            colnames = {col.replace(" ", ""): i for i, col in enumerate(header)}
+
+            # Read the remaining rows, skipping blank lines
+            rows = [row for row in reader if len(row) > 0]
+
+        # Bind the per-chunk worker arguments
+        worker = functools.partial(_process_snapshot_rows, colnames=colnames, config=config,
+                                   start_date_unixtime=start_date_unixtime, end_date_unixtime=end_date_unixtime)
+        work = rows
+    else:
+        # Collect the list of image files to parse
+        work = list(_iter_images(data_dir=config.input_dir, file_type=config.imgformat))
+
+        # Bind the per-chunk worker arguments
+        worker = functools.partial(_process_image_files, config=config,
+                                   start_date_unixtime=start_date_unixtime, end_date_unixtime=end_date_unixtime)
+
+    if n_workers > 1 and len(work) > 1:
+        # Split the work into one contiguous chunk per worker
+        chunk_size = -(-len(work) // n_workers)
+        chunks = [work[i:i + chunk_size] for i in range(0, len(work), chunk_size)]
+        # Process the chunks in parallel and merge the partial results in submission order
+        meta_pairs = []
+        errors = []
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for partial_pairs, partial_errors in executor.map(worker, chunks):
+                meta_pairs.extend(partial_pairs)
+                errors.extend(partial_errors)
+    else:
+        meta_pairs, errors = worker(work)
+
+    # Report the diagnostics buffered during parsing in a single write
+    if errors:
+        sys.stderr.write("".join(errors))
+
+    # Build the metadata dictionary in a single pass; later duplicates win, as before
+    meta = dict(meta_pairs)
+
+    return meta
+###########################################
+
+
+# Snapshot metadata parser
+###########################################
+def _process_snapshot_rows(rows, colnames, config, start_date_unixtime, end_date_unixtime):
+    """Parse image metadata from a chunk of SnapshotInfo.csv rows.
+
+    Args:
+        rows:                SnapshotInfo.csv data rows
+        colnames:            Dictionary of CSV column names and their index positions
+        config:              plantcv.parallel.WorkflowConfig object
+        start_date_unixtime: Start date in Unix time
+        end_date_unixtime:   End date in Unix time
+
+    :param rows: list
+    :param colnames: dict
+    :param config: plantcv.parallel.WorkflowConfig
+    :param start_date_unixtime: int
+    :param end_date_unixtime: int
+    :return meta_pairs: list
+    :return errors: list
+    """
+
+    # Accumulate (filename, metadata) pairs in a list to keep dictionary hashing off the hot path
+    meta_pairs = []
+
+    # Buffer diagnostic messages instead of writing them inside the hot loop
+    errors = []
+
+    # An empty CSV (no data rows) yields no metadata, and the required columns
+    # may be missing from a degenerate header, so skip the setup below entirely
+    if len(rows) == 0:
+        return meta_pairs, errors
 
     # A dictionary of metadata terms and their index position in the filename metadata term list
-    metadata_index = {}
-    for i, term in enumerate(config.filename_metadata):
-        metadata_index[term] = i
+    metadata_index = {term: i for i, term in enumerate(config.filename_metadata)}
 
     # How many metadata terms are in the files we intend to process?
     meta_count = len(config.filename_metadata)
 
-    # Compile regex (even if it's only a delimiter character)
-    regex = re.compile(config.delimiter)
+    # Normalize the user-provided metadata filters
+    metadata_filters = _normalize_filters(config.metadata_filters)
+
+    # Resolve the source of each metadata term once, instead of once per term per image,
+    # and gather the filtered terms separately so they can be evaluated first
+    filename_terms = []
+    csv_terms = []
+    filename_filters = []
+    csv_filters = []
+    # Terms not present in the filename or CSV always get their default value, so they are
+    # prebuilt into a template that is copied per image with a single dict() call
+    meta_template = {}
+    for term in config.metadata_terms:
+        # The term is stored in the image filename
+        if term in metadata_index:
+            idx = metadata_index[term]
+            filename_terms.append((term, idx))
+            if term in metadata_filters:
+                filename_filters.append((idx, metadata_filters[term]))
+        # The term is stored in a column of the CSV file
+        elif term in colnames:
+            col = colnames[term]
+            csv_terms.append((term, col))
+            if term in metadata_filters:
+                csv_filters.append((col, metadata_filters[term]))
+        # Otherwise the term gets its default value
+        else:
+            meta_template[term] = config.metadata_terms[term]["value"]
+
+    # Resolve the timestamp and image type sources so they can be read before metadata is built
+    ts_index = metadata_index.get("timestamp")
+    ts_col = colnames.get("timestamp")
+    ts_default = config.metadata_terms["timestamp"]["value"]
+    imgtype_index = metadata_index.get("imgtype")
+    imgtype_col = colnames.get("imgtype")
+    imgtype_default = config.metadata_terms["imgtype"]["value"]
+
+    # A single-character delimiter reduces _parse_filename to str.split, so inline it
+    # to avoid a Python function call per tile
+    delimiter = config.delimiter
+    fast_split = len(delimiter) == 1
+
+    # Coprocess images are matched on camera, and frame when available, in the filename metadata
+    coprocess_key = ()
+    if "camera" in metadata_index:
+        coprocess_key = (metadata_index["camera"],)
+        if "frame" in metadata_index:
+            coprocess_key += (metadata_index["frame"],)
+
+    # Column indexes used for every row
+    id_col = colnames['id']
+    tiles_col = colnames['tiles']
+
+    # Read through the CSV rows
+    for data in rows:
+        # Drop empty tile names, including the one left by a trailing separator; the old
+        # slice comparison checked everything but the last character and never stripped it
+        img_list = [img for img in data[tiles_col].split(';') if img]
+        if len(img_list) == 0:
+            continue
+
+        # Parse every tile filename exactly once per snapshot
+        if fast_split:
+            parsed_tiles = {img: img.split(delimiter) for img in img_list}
+        else:
+            parsed_tiles = {img: _parse_filename(filename=img, delimiter=delimiter)
+                            for img in img_list}
+
+        # Index the coprocess candidate tiles once per snapshot so each image needs only one lookup
+        coprocess_index = {}
+        if config.coprocess is not None:
+            for coimg, meta_parts in parsed_tiles.items():
+                if len(meta_parts) > 0 and meta_parts[metadata_index['imgtype']] == config.coprocess:
+                    coprocess_index[tuple(meta_parts[i] for i in coprocess_key)] = coimg
+
+        # All tiles in a snapshot live in the same directory, so a single directory read
+        # covers the existence checks for every tile instead of one stat call per file
+        dirpath = os.path.join(config.input_dir, 'snapshot' + data[id_col])
+        try:
+            present = set(os.listdir(dirpath))
+        except FileNotFoundError:
+            present = set()
+
+        for img in img_list:
+            filename = img + '.' + config.imgformat
+            if filename not in present:
+                errors.append(f"Something is wrong, file {dirpath}/{filename} does not exist\n")
+                continue
+                # raise IOError("Something is wrong, file {0}/{1} does not exist".format(dirpath, filename))
+            # Metadata from image file name
+            metadata = parsed_tiles[img]
+            # Not all images in a directory may have the same metadata structure only keep those that do
+            if len(metadata) == meta_count:
+                # Evaluate the metadata filters before any metadata is built
+                img_pass = 1
+                for idx, term_filter in filename_filters:
+                    # If the input value does not match the image value, fail the image
+                    if metadata[idx] not in term_filter:
+                        img_pass = 0
+                        break
+                if img_pass == 1:
+                    for col, term_filter in csv_filters:
+                        # If the input value does not match the image value, fail the image
+                        if data[col] not in term_filter:
+                            img_pass = 0
+                            break
+
+                # A failed image cannot be stored unless it may be kept for coprocessing
+                if img_pass == 0 and config.coprocess is None:
+                    continue
+
+                # Check the date range as soon as the timestamp is known
+                if ts_index is not None:
+                    timestamp = metadata[ts_index]
+                elif ts_col is not None:
+                    timestamp = data[ts_col]
+                else:
+                    timestamp = ts_default
+                if timestamp is not None:
+                    in_date_range = check_date_range(start_date_unixtime, end_date_unixtime,
+                                                     timestamp, config.timestampformat)
+                    if in_date_range is False:
+                        img_pass = 0
+
+                # Coprocess-type images are stored even when they fail the checks above
+                coimg_store = 0
+                if config.coprocess is not None:
+                    if imgtype_index is not None:
+                        imgtype = metadata[imgtype_index]
+                    elif imgtype_col is not None:
+                        imgtype = data[imgtype_col]
+                    else:
+                        imgtype = imgtype_default
+                    if imgtype == config.coprocess:
+                        coimg_store = 1
+
+                # Skip failing images before the metadata is assembled
+                if img_pass == 0 and coimg_store == 0:
+                    continue
+
+                # Image metadata, starting from a copy of the default-value template
+                img_path = os.path.join(dirpath, filename)
+                img_meta = dict(meta_template)
+                img_meta['path'] = img_path
+                # Metadata stored in the image filename
+                for term, idx in filename_terms:
+                    img_meta[term] = metadata[idx]
+                # Metadata stored in the CSV file
+                for term, col in csv_terms:
+                    img_meta[term] = data[col]
+
+                # If the image meets the user's criteria, store the metadata
+                if img_pass == 1:
+                    # Link image to coprocessed image
+                    if config.coprocess is not None:
+                        coimg = coprocess_index.get(tuple(metadata[i] for i in coprocess_key))
+                        if coimg is not None:
+                            img_meta['coimg'] = coimg + '.' + config.imgformat
+                        else:
+                            errors.append(f"Could not find an image to coprocess with {img_path}\n")
+                    meta_pairs.append((filename, img_meta))
+                elif coimg_store == 1:
+                    meta_pairs.append((filename, img_meta))
+
+    return meta_pairs, errors
+###########################################
 
-    # Check whether there is a snapshot metadata file or not
-    if os.path.exists(os.path.join(config.input_dir, "SnapshotInfo.csv")):
-        # Open the SnapshotInfo.csv file
-        csvfile = open(os.path.join(config.input_dir, 'SnapshotInfo.csv'), 'r')
-
-        # Read the first header line
-        header = csvfile.readline()
-        header = header.rstrip('\n')
-
-        # Remove whitespace from the field names
-        header = header.replace(" ", "")
-
-        # Table column order
-        cols = header.split(',')
-        colnames = {}
-        for i, col in enumerate(cols):
-            colnames[col] = i
-
-        # Read through the CSV file
-        for row in csvfile:
-            row = row.rstrip('\n')
-            data = row.split(',')
-            img_list_str = data[colnames['tiles']]
-            if img_list_str[:-1] == ';':
-                img_list_str = img_list_str[:-1]
-            img_list = img_list_str.split(';')
-            for img in img_list:
-                if len(img) != 0:
-                    dirpath = os.path.join(config.input_dir, 'snapshot' + data[colnames['id']])
-                    filename = img + '.' + config.imgformat
-                    if not os.path.exists(os.path.join(dirpath, filename)):
-                        print(f"Something is wrong, file {dirpath}/{filename} does not exist", file=sys.stderr)
-                        continue
-                        # raise IOError("Something is wrong, file {0}/{1} does not exist".format(dirpath, filename))
-                    # Metadata from image file name
-                    metadata = _parse_filename(filename=img, delimiter=config.delimiter, regex=regex)
-                    # Not all images in a directory may have the same metadata structure only keep those that do
-                    if len(metadata) == meta_count:
-                        # Image metadata
-                        img_path = os.path.join(dirpath, filename)
-                        img_meta = {'path': img_path}
-                        img_pass = 1
-                        coimg_store = 0
-                        # For each of the type of metadata PlantCV keeps track of
-                        for term in config.metadata_terms:
-                            # If the same metadata is found in the image filename, store the value
-                            if term in metadata_index:
-                                meta_value = metadata[metadata_index[term]]
-                                # If the metadata type has a user-provided restriction
-                                if term in config.metadata_filters:
-                                    # If the input value does not match the image value, fail the image
-                                    if meta_value != config.metadata_filters[term]:
-                                        img_pass = 0
-                                img_meta[term] = meta_value
-                            # If the same metadata is found in the CSV file, store the value
-                            elif term in colnames:
-                                meta_value = data[colnames[term]]
-                                # If the metadata type has a user-provided restriction
-                                if term in config.metadata_filters:
-                                    # If the input value does not match the image value, fail the image
-                                    if meta_value != config.metadata_filters[term]:
-                                        img_pass = 0
-                                img_meta[term] = meta_value
-                            # Or use the default value
-                            else:
-                                img_meta[term] = config.metadata_terms[term]["value"]
-
-                        if img_meta['timestamp'] is not None:
-                            in_date_range = check_date_range(start_date_unixtime, end_date_unixtime,
-                                                             img_meta['timestamp'], config.timestampformat)
-                            if in_date_range is False:
-                                img_pass = 0
-
-                        if config.coprocess is not None:
-                            if img_meta['imgtype'] == config.coprocess:
-                                coimg_store = 1
-
-                        # If the image meets the user's criteria, store the metadata
-                        if img_pass == 1:
-                            # Link image to coprocessed image
-                            coimg_pass = 0
-                            if config.coprocess is not None:
-                                for coimg in img_list:
-                                    if len(coimg) != 0:
-                                        meta_parts = _parse_filename(filename=coimg, delimiter=config.delimiter,
-                                                                     regex=regex)
-                                        if len(meta_parts) > 0:
-                                            coimgtype = meta_parts[metadata_index['imgtype']]
-                                            if coimgtype == config.coprocess:
-                                                if 'camera' in config.filename_metadata:
-                                                    cocamera = meta_parts[metadata_index['camera']]
-                                                    if 'frame' in config.filename_metadata:
-                                                        coframe = meta_parts[metadata_index['frame']]
-                                                        if cocamera == img_meta['camera'] and coframe == img_meta['frame']:
-                                                            img_meta['coimg'] = coimg + '.' + config.imgformat
-                                                            coimg_pass = 1
-                                                    else:
-                                                        if cocamera == img_meta['camera']:
-                                                            img_meta['coimg'] = coimg + '.' + config.imgformat
-                                                            coimg_pass = 1
-                                                else:
-                                                    img_meta['coimg'] = coimg + '.' + config.imgformat
-                                                    coimg_pass = 1
-                                if coimg_pass == 0:
-                                    print(f"Could not find an image to coprocess with {img_path}")
-                            meta[filename] = img_meta
-                        elif coimg_store == 1:
-                            meta[filename] = img_meta
-    else:
-        # Compile regular expression to remove image file extensions
-        pattern = re.escape('.') + config.imgformat + '$'
-        ext = re.compile(pattern, re.IGNORECASE)
-
-        # Walk through the input directory and find images that match input criteria
-        for (dirpath, dirnames, filenames) in os.walk(config.input_dir):
-            for filename in filenames:
-                # Is filename and image?
-                is_img = ext.search(filename)
-                # If filename is an image, parse the metadata
-                if is_img is not None:
-                    # Remove the file extension
-                    prefix = ext.sub('', filename)
-                    metadata = _parse_filename(filename=prefix, delimiter=config.delimiter, regex=regex)
-
-                    # Not all images in a directory may have the same metadata structure only keep those that do
-                    if len(metadata) == meta_count:
-                        # Image metadata
-                        img_path = os.path.join(dirpath, filename)
-                        img_meta = {'path': img_path}
-                        img_pass = 1
-                        # For each of the type of metadata PlantCV keeps track of
-                        for term in config.metadata_terms:
-                            # If the same metadata is found in the image filename, store the value
-                            if term in metadata_index:
-                                meta_value = metadata[metadata_index[term]]
-                                # If the metadata type has a user-provided restriction
-                                if term in config.metadata_filters:
-                                    # If the input value does not match the image value, fail the image
-                                    if meta_value != config.metadata_filters[term]:
-                                        img_pass = 0
-                                img_meta[term] = meta_value
-                            # Or use the default value
-                            else:
-                                img_meta[term] = config.metadata_terms[term]["value"]
-
-                        if img_meta['timestamp'] is not None:
-                            in_date_range = check_date_range(start_date_unixtime, end_date_unixtime,
-                                                             img_meta['timestamp'], config.timestampformat)
-                            if in_date_range is False:
-                                img_pass = 0
-
-                        # If the image meets the user's criteria, store the metadata
-                        if img_pass == 1:
-                            meta[filename] = img_meta
 
-    return meta
+# Image directory metadata parser
+###########################################
+def _process_image_files(images, config, start_date_unixtime, end_date_unixtime):
+    """Parse image metadata from a chunk of image files.
+
+    Args:
+        images:              List of (path, filename, prefix) tuples from _iter_images
+        config:              plantcv.parallel.WorkflowConfig object
+        start_date_unixtime: Start date in Unix time
+        end_date_unixtime:   End date in Unix time
+
+    :param images: list
+    :param config: plantcv.parallel.WorkflowConfig
+    :param start_date_unixtime: int
+    :param end_date_unixtime: int
+    :return meta_pairs: list
+    :return errors: list
+    """
+
+    # Accumulate (filename, metadata) pairs in a list to keep dictionary hashing off the hot path
+    meta_pairs = []
+
+    # Buffer diagnostic messages instead of writing them inside the hot loop
+    errors = []
+
+    # A dictionary of metadata terms and their index position in the filename metadata term list
+    metadata_index = {term: i for i, term in enumerate(config.filename_metadata)}
+
+    # How many metadata terms are in the files we intend to process?
+    meta_count = len(config.filename_metadata)
+
+    # Normalize the user-provided metadata filters
+    metadata_filters = _normalize_filters(config.metadata_filters)
+
+    # Resolve the source of each metadata term once, instead of once per term per image,
+    # and gather the filtered terms separately so they can be evaluated first
+    filename_terms = []
+    filename_filters = []
+    # Terms not present in the filename always get their default value, so they are
+    # prebuilt into a template that is copied per image with a single dict() call
+    meta_template = {}
+    for term in config.metadata_terms:
+        # The term is stored in the image filename
+        if term in metadata_index:
+            idx = metadata_index[term]
+            filename_terms.append((term, idx))
+            if term in metadata_filters:
+                filename_filters.append((idx, metadata_filters[term]))
+        # Otherwise the term gets its default value
+        else:
+            meta_template[term] = config.metadata_terms[term]["value"]
+
+    # Resolve the timestamp source so it can be read before metadata is built
+    ts_index = metadata_index.get("timestamp")
+    ts_default = config.metadata_terms["timestamp"]["value"]
+
+    # A single-character delimiter reduces _parse_filename to str.split, so inline it
+    # to avoid a Python function call per image
+    delimiter = config.delimiter
+    fast_split = len(delimiter) == 1
+
+    for img_path, filename, prefix in images:
+        # Parse the metadata from the filename with the extension removed
+        if fast_split:
+            metadata = prefix.split(delimiter)
+        else:
+            metadata = _parse_filename(filename=prefix, delimiter=delimiter)
+
+        # Not all images in a directory may have the same metadata structure only keep those that do
+        if len(metadata) == meta_count:
+            # Evaluate the metadata filters before any metadata is built
+            img_pass = 1
+            for idx, term_filter in filename_filters:
+                # If the input value does not match the image value, fail the image
+                if metadata[idx] not in term_filter:
+                    img_pass = 0
+                    break
+
+            # Skip the image as soon as a filter fails
+            if img_pass == 0:
+                continue
+
+            # Check the date range as soon as the timestamp is known
+            timestamp = metadata[ts_index] if ts_index is not None else ts_default
+            if timestamp is not None:
+                in_date_range = check_date_range(start_date_unixtime, end_date_unixtime,
+                                                 timestamp, config.timestampformat)
+                if in_date_range is False:
+                    continue
+
+            # Image metadata, starting from a copy of the default-value template
+            img_meta = dict(meta_template)
+            img_meta['path'] = img_path
+            # Metadata stored in the image filename
+            for term, idx in filename_terms:
+                img_meta[term] = metadata[idx]
+
+            # The image meets the user's criteria, store the metadata
+            meta_pairs.append((filename, img_meta))
+
+    return meta_pairs, errors
+###########################################
+
+
+# Metadata filter normalization
+###########################################
+def _normalize_filters(metadata_filters):
+    """Normalize metadata filters to frozensets of allowed values.
+
+    Args:
+        metadata_filters:  Dictionary of metadata filters (single values or lists of values)
+
+    :param metadata_filters: dict
+    :return normalized: dict
+    """
+
+    # Frozenset membership checks are constant time and a filter can be
+    # a single value or a list of allowed values
+    normalized = {}
+    for term, value in metadata_filters.items():
+        if isinstance(value, (list, tuple, set, frozenset)):
+            normalized[term] = frozenset(value)
+        else:
+            normalized[term] = frozenset([value])
+    return normalized
 ###########################################
 
 
@@ -248,28 +468,115 @@ def convert_datetime_to_unixtime(timestamp_str, date_format):
     """
     # Convert image datetime to unix time
     try:
-        timestamp = datetime.datetime.strptime(timestamp_str, date_format)
+        timestamp = _parse_timestamp(timestamp_str=timestamp_str, date_format=date_format)
     except ValueError as e:
         raise SystemExit(str(e) + '\n  --> Please specify the correct timestampformat parameter <--\n')
 
-    time_delta = timestamp - datetime.datetime(1970, 1, 1)
-    unix_time = (time_delta.days * 24 * 3600) + time_delta.seconds
+    unix_time = int(timestamp.replace(tzinfo=datetime.timezone.utc).timestamp())
     return unix_time
 
 
+# datetime.fromisoformat was added in Python 3.7, fall back to strptime on older versions
+_FROMISOFORMAT = getattr(datetime.datetime, "fromisoformat", None)
+
+# Fast-path patterns for ISO-like timestamp formats that datetime.fromisoformat can parse
+_ISO_FORMAT_PATTERNS = {
+    "%Y-%m-%d %H:%M:%S.%f": re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}(?:\d{3})?$"),
+    "%Y-%m-%d %H:%M:%S": re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$"),
+    "%Y-%m-%dT%H:%M:%S": re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$"),
+}
+
+
+# Timestamp string parser
+###########################################
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp_str, date_format):
+    """Parse a timestamp string into a datetime, with caching.
+
+    Args:
+        timestamp_str: a datetime string
+        date_format:   date format code for strptime
+
+    :param timestamp_str: str
+    :param date_format: str
+    :return: datetime.datetime
+    """
+
+    # datetime.fromisoformat is C-implemented and much faster than strptime, but it is also
+    # laxer, so it is only used when the string matches the shape of the expected format
+    iso_pattern = _ISO_FORMAT_PATTERNS.get(date_format) if _FROMISOFORMAT is not None else None
+    if iso_pattern is not None and iso_pattern.match(timestamp_str):
+        try:
+            return _FROMISOFORMAT(timestamp_str)
+        except ValueError:
+            pass
+    return datetime.datetime.strptime(timestamp_str, date_format)
+###########################################
+
+
+# Image file iterator
+###########################################
+def _iter_images(data_dir, file_type):
+    """Recursively find image files of the input file type.
+
+    Args:
+        data_dir:   Directory to search for image files
+        file_type:  Image file type extension (e.g. "png")
+
+    :param data_dir: str
+    :param file_type: str
+    :return: generator of (path, filename, prefix) tuples
+    """
+
+    # Match the file extension (case-insensitive) with a single suffix comparison per file
+    suffix = '.' + file_type.lower()
+    ext_len = len(suffix)
+    # Stack of directories left to scan, starting with the input directory
+    dirs = [data_dir]
+    while dirs:
+        try:
+            entries = os.scandir(dirs.pop())
+        except OSError:
+            # Skip unreadable directories, like os.walk does
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(suffix):
+                    # Strip the file extension with a slice instead of a regex substitution
+                    yield entry.path, entry.name, entry.name[:-ext_len]
+###########################################
+
+
+# Delimiter regular expression cache
+###########################################
+@functools.lru_cache(maxsize=32)
+def _get_delim_regex(delimiter):
+    """Compile and cache the delimiter regular expression.
+
+    Args:
+        delimiter:  Delimiter regular expression pattern
+
+    :param delimiter: str
+    :return: re.Pattern
+    """
+
+    return re.compile(delimiter)
+###########################################
+
+
 # Filename metadata parser
 ###########################################
-def _parse_filename(filename, delimiter, regex):
+def _parse_filename(filename, delimiter):
     """Parse the input filename and return a list of metadata.
 
     Args:
         filename:   Filename to parse metadata from
         delimiter:  Delimiter character to split the filename on
-        regex:      Compiled regular expression pattern to process file with
 
     :param filename: str
     :param delimiter: str
-    :param regex: re.Pattern
     :return metadata: list
     """
 
@@ -277,7 +584,8 @@ def _parse_filename(filename, delimiter, regex):
     if len(delimiter) == 1:
         metadata = filename.split(delimiter)
     else:
-        metadata = re.search(regex, filename)
+        # Otherwise treat the delimiter as a regular expression (compiled once per pattern)
+        metadata = _get_delim_regex(delimiter).search(filename)
         if metadata is not None:
             metadata = list(metadata.groups())
         else:
@@ -328,6 +328,61 @@ def test_plantcv_parallel_metadata_parser_snapshots():
     assert meta == METADATA_VIS_ONLY
 
 
+def test_plantcv_parallel_metadata_parser_snapshots_multiple_workers():
+    # Create config instance
+    config = plantcv.parallel.WorkflowConfig()
+    config.input_dir = os.path.join(PARALLEL_TEST_DATA, TEST_SNAPSHOT_DIR)
+    config.json = os.path.join(TEST_TMPDIR, "test_plantcv_parallel_metadata_parser_snapshots_multiple_workers",
+                               "output.json")
+    config.filename_metadata = ["imgtype", "camera", "frame", "zoom", "lifter", "gain", "exposure", "id"]
+    config.workflow = TEST_PIPELINE
+    config.metadata_filters = {"imgtype": "VIS", "camera": "SV"}
+    config.start_date = "2014-10-21 00:00:00.0"
+    config.end_date = "2014-10-23 00:00:00.0"
+    config.timestampformat = '%Y-%m-%d %H:%M:%S.%f'
+    config.imgformat = "jpg"
+    config.cluster_config["n_workers"] = 2
+
+    meta = plantcv.parallel.metadata_parser(config=config)
+    assert meta == METADATA_VIS_ONLY
+
+
+def test_plantcv_parallel_metadata_parser_snapshots_empty_csv():
+    # Create an input directory containing only an empty SnapshotInfo.csv file
+    cache_dir = os.path.join(TEST_TMPDIR, "test_plantcv_parallel_metadata_parser_snapshots_empty_csv")
+    os.makedirs(cache_dir, exist_ok=True)
+    open(os.path.join(cache_dir, "SnapshotInfo.csv"), "w").close()
+    # Create config instance
+    config = plantcv.parallel.WorkflowConfig()
+    config.input_dir = cache_dir
+    config.json = os.path.join(cache_dir, "output.json")
+    config.filename_metadata = ["imgtype", "camera", "frame", "zoom", "lifter", "gain", "exposure", "id"]
+    config.workflow = TEST_PIPELINE
+    config.imgformat = "jpg"
+
+    meta = plantcv.parallel.metadata_parser(config=config)
+    assert meta == {}
+
+
+def test_plantcv_parallel_metadata_parser_snapshots_list_filter():
+    # Create config instance
+    config = plantcv.parallel.WorkflowConfig()
+    config.input_dir = os.path.join(PARALLEL_TEST_DATA, TEST_SNAPSHOT_DIR)
+    config.json = os.path.join(TEST_TMPDIR, "test_plantcv_parallel_metadata_parser_snapshots_list_filter",
+                               "output.json")
+    config.filename_metadata = ["imgtype", "camera", "frame", "zoom", "lifter", "gain", "exposure", "id"]
+    config.workflow = TEST_PIPELINE
+    config.metadata_filters = {"imgtype": ["VIS", "NIR"], "camera": "SV"}
+    config.start_date = "2014-10-21 00:00:00.0"
+    config.end_date = "2014-10-23 00:00:00.0"
+    config.timestampformat = '%Y-%m-%d %H:%M:%S.%f'
+    config.imgformat = "jpg"
+
+    meta = plantcv.parallel.metadata_parser(config=config)
+    expected = {**METADATA_VIS_ONLY, **METADATA_NIR_ONLY}
+    assert meta == expected
+
+
 def test_plantcv_parallel_metadata_parser_snapshots_coimg():
     # Create config instance
     config = plantcv.parallel.WorkflowConfig()